@@ -1,24 +1,24 @@
 import sys
 import math
-import random
-import string
-from datetime import datetime
+from datetime import date
 
 # ---------- Input Utilities ----------
+_QUIT_WORDS = frozenset(("q", "quit", "exit"))
+
 def _raw(prompt: str) -> str:
-    """Basic input wrapper. Allows quitting with q/quit/exit at sub-prompts."""
-    value = input(f"{prompt} (q to quit): ")
-    if value.lower() in ("q", "quit", "exit"):
+    """Read a stripped, lowercased answer. Quits on q/quit/exit at sub-prompts."""
+    value = input(f"{prompt} (q to quit): ").strip().lower()
+    if value in _QUIT_WORDS:
         sys.exit()
     return value
 
-def _yn(prompt: str) -> bool:
-    """Prompt the user for yes/no input until valid."""
+def _flags(prompt: str, valid: frozenset) -> set:
+    """Prompt for one or more single-letter options (e.g. 'uld') until valid."""
     while True:
-        val = _raw(f"{prompt} (y/n)").strip().lower()
-        if val in ("y", "n"):
-            return val == "y"
-        print("Please enter y or n.")
+        chosen = set(_raw(prompt)) - {" ", ","}
+        if chosen and chosen <= valid:
+            return chosen
+        print(f"Enter one or more of: {' '.join(sorted(valid))}.")
 
 def _num(prompt: str, caster=float, min_value=None):
     """Prompt for a number, re-asking until valid. Enforce minimum if set."""
@@ -34,167 +34,160 @@ def _num(prompt: str, caster=float, min_value=None):
 
 
 # ---------- Core Functions ----------
-def SecurePasswordGenerator():
-    """Factory returning a password generator function."""
-    def generate_password(length=12, use_upper=True, use_lower=True,
-                          use_digits=True, use_special=True):
-        """Generate a secure password based on user settings."""
-        if length < 8:
-            raise ValueError("Password length should be at least 8 characters.")
-
-        # Select available character sets based on user choices
-        lowercase = string.ascii_lowercase if use_lower else ""
-        uppercase = string.ascii_uppercase if use_upper else ""
-        digits = string.digits if use_digits else ""
-        special = string.punctuation if use_special else ""
-
-        if not (lowercase or uppercase or digits or special):
-            raise ValueError("At least one character set must be selected.")
-
-        all_chars = lowercase + uppercase + digits + special
-
-        # Ensure one of each selected type is included
-        password = []
-        if use_lower:
-            password.append(random.choice(string.ascii_lowercase))
-        if use_upper:
-            password.append(random.choice(string.ascii_uppercase))
-        if use_digits:
-            password.append(random.choice(string.digits))
-        if use_special:
-            password.append(random.choice(string.punctuation))
-
-        # Fill the rest randomly
-        while len(password) < length:
-            password.append(random.choice(all_chars))
-
-        random.shuffle(password)
-        return "".join(password)
-
-    return generate_password
-
-def CalculateAFormalPercentage():
-    """Factory returning a percentage calculator function."""
-    def calculate_percentage(part, whole, decimals=2):
-        """Return (part/whole * 100), rounded to the specified decimals."""
-        if whole == 0:
-            return 0
-        return round((part / whole) * 100, decimals)
-    return calculate_percentage
-
-def HowManyDaysUntilJulyFour():
-    """Factory returning a function that calculates days until July 4, 2025."""
-    def days_until_july_four():
-        """Return non-negative integer days until July 4, 2025."""
-        today = datetime.now()
-        target = datetime(2025, 7, 4)
-        days = (target - today).days
-        return days if days > 0 else 0
-    return days_until_july_four
-
-def LegOfTriangle():
-    """Factory returning a Law of Cosines function."""
-    def calculate_leg(a, b, angle_degrees):
-        """Return side c given sides a, b and included angle."""
-        angle_radians = math.radians(angle_degrees)
-        return math.sqrt(a**2 + b**2 - (2 * a * b * math.cos(angle_radians)))
-    return calculate_leg
-
-def VolRightCircularCylinder():
-    """Factory returning a volume calculator for right circular cylinder."""
-    def volume_cylinder(radius, height):
-        """Return volume; both radius and height must be non-negative."""
-        if radius < 0 or height < 0:
-            raise ValueError("Radius and height must be non-negative.")
-        return math.pi * (radius ** 2) * height
-    return volume_cylinder
-
-def ProgramsExit():
-    """Factory returning an exit function."""
-    def exit_program():
-        """Exit program immediately."""
-        sys.exit()
-    return exit_program
+def _build_password_tables():
+    """Map each (upper, lower, digits, special) flag tuple to ASCII charsets."""
+    import itertools
+    import string
+
+    tables = {}
+    for flags in itertools.product((False, True), repeat=4):
+        use_upper, use_lower, use_digits, use_special = flags
+        mandatory = tuple(charset for charset, used in (
+            (string.ascii_lowercase.encode("ascii"), use_lower),
+            (string.ascii_uppercase.encode("ascii"), use_upper),
+            (string.digits.encode("ascii"), use_digits),
+            (string.punctuation.encode("ascii"), use_special),
+        ) if used)
+        tables[flags] = (b"".join(mandatory), mandatory)
+    return tables
+
+_PASSWORD_STATE = {}
+
+def _password_state():
+    """Return (charset tables, SystemRandom), importing on first use."""
+    if not _PASSWORD_STATE:
+        import secrets
+        _PASSWORD_STATE["tables"] = _build_password_tables()
+        _PASSWORD_STATE["rng"] = secrets.SystemRandom()
+    return _PASSWORD_STATE["tables"], _PASSWORD_STATE["rng"]
+
+def generate_password(length=12, use_upper=True, use_lower=True,
+                      use_digits=True, use_special=True):
+    """Generate a secure password based on user settings."""
+    if length < 8:
+        raise ValueError("Password length should be at least 8 characters.")
+
+    # Look up available character sets based on user choices
+    tables, rng = _password_state()
+    all_chars, mandatory = tables[(bool(use_upper), bool(use_lower),
+                                   bool(use_digits), bool(use_special))]
+    if not all_chars:
+        raise ValueError("At least one character set must be selected.")
+
+    buf = bytearray(length)
+
+    # Ensure one of each selected type is included
+    i = 0
+    for charset in mandatory:
+        buf[i] = rng.choice(charset)
+        i += 1
+
+    # Fill the rest randomly in a single batched draw
+    buf[i:] = bytes(rng.choices(all_chars, k=length - i))
+
+    # Shuffle in place, then decode once into the final string
+    rng.shuffle(buf)
+    return buf.decode("ascii")
+
+def calculate_percentage(part, whole, decimals=2):
+    """Return (part/whole * 100), rounded to the specified decimals."""
+    if whole == 0:
+        return 0
+    return round((part / whole) * 100, decimals)
+
+# Target date for the July 4 countdown, as a proleptic Gregorian ordinal
+_JULY_FOUR_ORD = date(2025, 7, 4).toordinal()
+
+def days_until_july_four():
+    """Return non-negative integer days until July 4, 2025."""
+    return max(0, _JULY_FOUR_ORD - date.today().toordinal())
+
+def calculate_leg(a, b, angle_degrees):
+    """Return side c given sides a, b and included angle."""
+    angle_radians = math.radians(angle_degrees)
+    return math.sqrt(a * a + b * b - (2 * a * b * math.cos(angle_radians)))
+
+def volume_cylinder(radius, height):
+    """Return volume; both radius and height must be non-negative."""
+    if radius < 0 or height < 0:
+        raise ValueError("Radius and height must be non-negative.")
+    return math.pi * radius * radius * height
+
+def exit_program():
+    """Exit program immediately."""
+    sys.exit()
 
 
 # ---------- Menu Option Handlers ----------
-def _handle_password(password_gen):
+_CHARSET_FLAGS = frozenset("ulds")
+
+def _handle_password():
     """Handle password generation option (a)."""
     length = _num("Length (>=8)", int, 8)
-    use_upper = _yn("Include uppercase?")
-    use_lower = _yn("Include lowercase?")
-    use_digits = _yn("Include digits?")
-    use_special = _yn("Include special characters?")
-    # Ensure at least one set is selected
-    while not (use_upper or use_lower or use_digits or use_special):
-        print("Select at least one character set.")
-        use_upper = _yn("Include uppercase?")
-        use_lower = _yn("Include lowercase?")
-        use_digits = _yn("Include digits?")
-        use_special = _yn("Include special characters?")
-    print(password_gen(length, use_upper, use_lower, use_digits, use_special))
-
-def _handle_percentage(percentage_calc):
+    # One prompt for all character sets; _flags re-asks until one is picked
+    flags = _flags("Include (u)pper (l)ower (d)igits (s)pecial? e.g. uld",
+                   _CHARSET_FLAGS)
+    print(generate_password(length, "u" in flags, "l" in flags,
+                            "d" in flags, "s" in flags))
+
+def _handle_percentage():
     """Handle percentage calculation option (b)."""
     part = _num("Numerator")
     whole = _num("Denominator")
     decimals = _num("Decimals", int)
-    print(f"{percentage_calc(part, whole, decimals)} %")
+    value = (part / whole) * 100 if whole != 0 else 0
+    # Format specs can't round to tens, hundreds, ...; only then use round()
+    if decimals < 0:
+        value = round(value, decimals)
+    print(f"{value:.{max(decimals, 0)}f} %")
 
-def _handle_days(days_until):
+def _handle_days():
     """Handle option (c): days until July 4, 2025."""
-    print(f"{days_until()} days")
+    print(f"{days_until_july_four()} days")
 
-def _handle_cosine(cosine_calc):
+def _handle_cosine():
     """Handle option (d): calculate triangle side using cosine rule."""
     a = _num("Side a")
     b = _num("Side b")
     angle = _num("Angle (degrees)")
-    print(cosine_calc(a, b, angle))
+    print(calculate_leg(a, b, angle))
 
-def _handle_cylinder(cylinder_vol):
+def _handle_cylinder():
     """Handle option (e): volume of a right circular cylinder."""
     radius = _num("Radius")
     height = _num("Height")
-    print(cylinder_vol(radius, height))
+    print(volume_cylinder(radius, height))
 
 
 # ---------- Main Menu ----------
+_MENU_TEXT = (
+    "\n(a) Password Generator"
+    "\n(b) Calculate and Format Percentage"
+    "\n(c) Days until July 4, 2025"
+    "\n(d) Calculate Leg of Triangle"
+    "\n(e) Right Cylinder Volume"
+    "\n(f) Exit"
+)
+
+# Menu choice -> handler
+_DISPATCH = {
+    "a": _handle_password,
+    "b": _handle_percentage,
+    "c": _handle_days,
+    "d": _handle_cosine,
+    "e": _handle_cylinder,
+    "f": exit_program,
+}
+
 def menu():
     """Main program loop. Quit only with option (f) or sub-prompt 'q'."""
-    password_gen = SecurePasswordGenerator()
-    percentage_calc = CalculateAFormalPercentage()
-    days_until = HowManyDaysUntilJulyFour()
-    cosine_calc = LegOfTriangle()
-    cylinder_vol = VolRightCircularCylinder()
-    exit_program = ProgramsExit()
-
     while True:
-        print(
-            "\n(a) Password Generator"
-            "\n(b) Calculate and Format Percentage"
-            "\n(c) Days until July 4, 2025"
-            "\n(d) Calculate Leg of Triangle"
-            "\n(e) Right Cylinder Volume"
-            "\n(f) Exit"
-        )
-        choice = input("Choice: ").lower()
-
-        if choice == "a":
-            _handle_password(password_gen)
-        elif choice == "b":
-            _handle_percentage(percentage_calc)
-        elif choice == "c":
-            _handle_days(days_until)
-        elif choice == "d":
-            _handle_cosine(cosine_calc)
-        elif choice == "e":
-            _handle_cylinder(cylinder_vol)
-        elif choice == "f":
-            exit_program()
-        else:
+        print(_MENU_TEXT)
+        handler = _DISPATCH.get(input("Choice: ").lower())
+        if handler is None:
             print("Invalid option.")
-
+        else:
+            handler()
 
 if __name__ == "__main__":
     menu()